@@ -3,13 +3,155 @@ logger = logging.getLogger(__name__)
 
 import os
 import re
-import json
-from tempfile import mkstemp
 from PyQt5 import QtWidgets, QtGui, QtCore
-from .workers import CreateEvent, CompareEvent
+from .workers import CreateEvent, CompareEvent, ViewEvent, DeleteEvent
 
 from PyQt5 import QtWidgets, QtCore
 
+# Script directory and the tag used to name its output directory
+_MODULE_DIR = os.path.dirname(__file__)
+_MODULE_TAG = os.path.basename(_MODULE_DIR).upper()
+
+# Icons loaded from the assets directory, keyed by filename (without extension)
+_ICON_CACHE = {}
+
+# Icons available in the assets directory
+_ICON_NAMES = ("open-file", "delete", "compare", "xls", "opened-folder")
+
+# Largest size any icon is displayed at (buttons use 25x25, menus ~16x16)
+_ICON_SIZE = QtCore.QSize(32, 32)
+
+# Snapshot filenames: [<type>]_[<name>]_[<timestamp>].json, names may contain brackets
+_SNAPSHOT_RE = re.compile(r'^\[([^\]]+)\]_\[(.+)\]_\[([^\]]+)\]\.json$')
+
+# Labelled fields at the top of the Create group: (name, label, widget class, attribute suffix, minimum size)
+_TOP_FIELDS = (
+    ("name", "Name", QtWidgets.QLineEdit, "line_edit", (0, 25)),
+    ("type", "Type", QtWidgets.QComboBox, "combobox", (80, 25)),
+)
+
+# Buttons below the snapshots table: (text, attribute, icon)
+_ACTION_BUTTONS = (
+    ("Last Report", "report_button", "xls"),
+    ("Folder", "folder_button", "opened-folder"),
+)
+
+
+def _load_icon(filename):
+    """
+    Read an icon from the assets directory, downscaled to the display size.
+
+    Args:
+        filename (str): Name of the icon file (without extension).
+
+    Returns:
+        QtGui.QIcon: The QIcon object.
+    """
+    icon_path = os.path.join(_MODULE_DIR, "assets", f"{filename}.ico")
+    icon = QtGui.QIcon()
+    pixmap = QtGui.QPixmap(icon_path).scaled(_ICON_SIZE, QtCore.Qt.KeepAspectRatio,
+                                             QtCore.Qt.SmoothTransformation)
+    icon.addPixmap(pixmap, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+    return icon
+
+
+class SnapshotModel(QtCore.QAbstractTableModel):
+    """
+    Table model holding the snapshots listed in the snapshots table.
+
+    Each row is a snapshot dictionary with 'name', 'type', 'timestamp' and 'filename' keys.
+    """
+    columns = ('name', 'type', 'timestamp')
+    headers = ('Name', 'Type', 'Timestamp')
+
+    def __init__(self, parent=None):
+        """
+        Initialize an empty snapshot model.
+
+        Args:
+            parent (QObject): Parent object.
+        """
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of snapshots in the model.
+        """
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of displayed columns.
+        """
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the display text of the snapshot field at the given index, or the
+        whole snapshot dictionary for `Qt.UserRole`.
+        """
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self._rows[index.row()][self.columns[index.column()]]
+        if role == QtCore.Qt.UserRole:
+            return self._rows[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the horizontal header labels.
+        """
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def add_snapshot(self, snapshot):
+        """
+        Appends a snapshot to the end of the model.
+
+        Args:
+            snapshot (dict): Snapshot information with 'name', 'type' and 'timestamp' keys.
+        """
+        self.add_snapshots([snapshot])
+
+    def add_snapshots(self, snapshots):
+        """
+        Appends several snapshots to the end of the model in a single insert.
+
+        Args:
+            snapshots (iterable): Snapshot dictionaries with 'name', 'type' and 'timestamp' keys.
+        """
+        snapshots = list(snapshots)
+        if not snapshots:
+            return
+        row = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + len(snapshots) - 1)
+        self._rows.extend(snapshots)
+        self.endInsertRows()
+
+    def remove_snapshots(self, filenames):
+        """
+        Removes the snapshots with the given file names, one removal per contiguous block.
+
+        Rows are looked up when called, so removals stay correct after earlier
+        inserts or deletions shifted the table.
+
+        Args:
+            filenames (list): Snapshot file names.
+        """
+        filenames = set(filenames)
+        # Walk from the bottom so earlier removals do not shift pending indices
+        rows = [row for row in range(len(self._rows) - 1, -1, -1) if self._rows[row]['filename'] in filenames]
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+
 
 class Ui_Form(object):
     """
@@ -38,26 +180,10 @@ class Ui_Form(object):
         self.create_top_layout.setSpacing(30)
         self.create_layout.addLayout(self.create_top_layout)
 
-        # --- Name input ---
-        self.name_layout = QtWidgets.QHBoxLayout()
-        self.name_layout.setSpacing(10)
-        self.name_label = QtWidgets.QLabel("Name", self.create_group_box)
-        self.name_layout.addWidget(self.name_label)
-        self.name_line_edit = QtWidgets.QLineEdit(self.create_group_box)
-        self.name_line_edit.setMinimumSize(QtCore.QSize(0, 25))
-        self.name_layout.addWidget(self.name_line_edit)
-        self.create_top_layout.addLayout(self.name_layout)
-
-        # --- Type combobox ---
-        self.type_layout = QtWidgets.QHBoxLayout()
-        self.type_layout.setSpacing(10)
-        self.type_label = QtWidgets.QLabel("Type", self.create_group_box)
-        self.type_layout.addWidget(self.type_label)
-        self.type_combobox = QtWidgets.QComboBox(self.create_group_box)
+        # --- Name input / Type combobox ---
+        for spec in _TOP_FIELDS:
+            self._add_field(self.create_top_layout, self.create_group_box, *spec)
         self.type_combobox.addItems(["Pre", "Post"])
-        self.type_combobox.setMinimumSize(QtCore.QSize(80, 25))
-        self.type_layout.addWidget(self.type_combobox)
-        self.create_top_layout.addLayout(self.type_layout)
 
         # --- Devices text area ---
         self.device_group_box = QtWidgets.QGroupBox("Devices", self.create_group_box)
@@ -82,16 +208,21 @@ class Ui_Form(object):
         self.snapshots_layout.setSpacing(15)
 
         # --- Snapshots table ---
-        self.snapshots_table = QtWidgets.QTableWidget(self.snapshots_group_box)
-        self.snapshots_table.setColumnCount(3)
-        self.snapshots_table.setHorizontalHeaderLabels(["Name", "Type", "Timestamp"])
+        self.snapshots_model = SnapshotModel(self.snapshots_group_box)
+        self.snapshots_table = QtWidgets.QTableView(self.snapshots_group_box)
+        self.snapshots_table.setModel(self.snapshots_model)
         self.snapshots_table.horizontalHeader().setHighlightSections(False)
         self.snapshots_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.snapshots_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.snapshots_table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.snapshots_table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.snapshots_table.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.Fixed)
+        self.snapshots_table.horizontalHeader().setSectionResizeMode(2, QtWidgets.QHeaderView.Fixed)
         self.snapshots_table.setColumnWidth(1, 60)
         self.snapshots_table.setColumnWidth(2, 150)
+        # Fixed row heights keep layout independent of the number of snapshots
+        self.snapshots_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.snapshots_table.verticalHeader().setDefaultSectionSize(22)
         self.snapshots_table.verticalHeader().setVisible(False)
         self.snapshots_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.snapshots_table.customContextMenuRequested.connect(self.table_menu_event)
@@ -127,38 +258,71 @@ class Ui_Form(object):
         self.actions_layout.setSpacing(10)
         self.snapshots_layout.addLayout(self.actions_layout)
 
-        self.report_button = QtWidgets.QPushButton("Last Report", self.snapshots_group_box)
-        self.report_button.setIcon(self._get_icon("xls"))
-        self.report_button.setIconSize(QtCore.QSize(25, 25))
-        self.report_button.setMinimumSize(QtCore.QSize(150, 0))
-        self.report_button.setDisabled(True)
-        self.actions_layout.addWidget(self.report_button)
-
         self.folder_action = QtWidgets.QAction("Folder", self.snapshots_group_box)
         self.folder_action.setIcon(self._get_icon("opened-folder"))
         self.table_menu.addAction(self.folder_action)
 
-        self.folder_button = QtWidgets.QPushButton("Folder", self.snapshots_group_box)
-        self.folder_button.setIcon(self._get_icon("opened-folder"))
-        self.folder_button.setIconSize(QtCore.QSize(25, 25))
-        self.folder_button.setMinimumSize(QtCore.QSize(150, 0))
-        self.actions_layout.addWidget(self.folder_button)
+        for text, attr, icon in _ACTION_BUTTONS:
+            button = QtWidgets.QPushButton(text, self.snapshots_group_box)
+            button.setIcon(self._get_icon(icon))
+            button.setIconSize(QtCore.QSize(25, 25))
+            button.setMinimumSize(QtCore.QSize(150, 0))
+            self.actions_layout.addWidget(button)
+            setattr(self, attr, button)
+        self.report_button.setDisabled(True)
 
         self.actions_layout.addItem(QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Expanding))
 
+    def _add_field(self, parent_layout, parent, name, label, widget_cls, suffix, min_size):
+        """
+        Add a labelled input field to a layout.
+
+        The created layout, label and widget are stored as `<name>_layout`,
+        `<name>_label` and `<name>_<suffix>` attributes respectively.
+
+        Args:
+            parent_layout (QLayout): Layout the field is added to.
+            parent (QWidget): Parent widget of the label and input widget.
+            name (str): Attribute prefix of the field.
+            label (str): Label text.
+            widget_cls (type): Input widget class.
+            suffix (str): Attribute suffix of the input widget.
+            min_size (tuple): Minimum width and height of the input widget.
+        """
+        layout = QtWidgets.QHBoxLayout()
+        layout.setSpacing(10)
+        label_widget = QtWidgets.QLabel(label, parent)
+        layout.addWidget(label_widget)
+        widget = widget_cls(parent)
+        widget.setMinimumSize(QtCore.QSize(*min_size))
+        layout.addWidget(widget)
+        parent_layout.addLayout(layout)
+
+        setattr(self, f"{name}_layout", layout)
+        setattr(self, f"{name}_label", label_widget)
+        setattr(self, f"{name}_{suffix}", widget)
+
     def _get_icon(self, filename: str) -> QtGui.QIcon:
         """
         Load an icon from the assets directory.
 
+        Icons are cached per process, so each file is read and decoded only once,
+        and downscaled to the display size so no full-resolution pixmap is retained.
+        All known asset icons are loaded together on the first call.
+
         Args:
             filename (str): Name of the icon file (without extension).
 
         Returns:
             QtGui.QIcon: The QIcon object.
         """
-        icon_path = os.path.join(os.path.dirname(__file__), "assets", f"{filename}.ico")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(icon_path), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        if not _ICON_CACHE:
+            for name in _ICON_NAMES:
+                _ICON_CACHE[name] = _load_icon(name)
+
+        icon = _ICON_CACHE.get(filename)
+        if icon is None:
+            icon = _ICON_CACHE[filename] = _load_icon(filename)
         return icon
 
     def table_menu_event(self, pos):
@@ -198,37 +362,18 @@ class Ui_Form(object):
             - 'name': Snapshot name
             - 'type': Snapshot type
             - 'timestamp': Snapshot timestamp
+            - 'filename': Snapshot file name in the snapshots directory
             - 'row': The row index of the snapshot in the table
 
         Returns:
             list: A list of dictionaries containing the selected snapshot information.
         """
         selected_data = []
-        name = ''
-        snapshot_type = ''
-        timestamp = ''
-
-        for item in self.snapshots_table.selectedItems():
-            # Read the appropriate column data
-            if item.column() == 0:
-                name = item.text()
-            elif item.column() == 1:
-                snapshot_type = item.text()
-            elif item.column() == 2:
-                timestamp = item.text()
-
-            # If all fields are collected, append a snapshot entry
-            if name and snapshot_type and timestamp:
-                selected_data.append({
-                    'name': name,
-                    'type': snapshot_type,
-                    'timestamp': timestamp,
-                    'row': item.row()
-                })
-                # Reset fields for the next snapshot
-                name = ''
-                snapshot_type = ''
-                timestamp = ''
+
+        # One index per selected row, returned in table order regardless of selection order
+        indexes = sorted(self.snapshots_table.selectionModel().selectedRows(), key=lambda x: x.row())
+        for index in indexes:
+            selected_data.append(dict(index.data(QtCore.Qt.UserRole), row=index.row()))
 
         return selected_data
 
@@ -250,44 +395,50 @@ class Form(QtWidgets.QWidget, Ui_Form):
         super().__init__(parent)
         self.kwargs = kwargs
         self.session = kwargs.get("session")
-        self.output_dir = os.path.join(self.kwargs.get("output_dir"),
-                                       os.path.basename(os.path.dirname(__file__).upper()))
+        self.output_dir = os.path.join(self.kwargs.get("output_dir"), _MODULE_TAG)
+        self.snapshots_path = os.path.join(self.output_dir, 'Snapshots')
         self.output_report = ""
+        # View and delete workers that are still running, kept referenced until they finish
+        self.running_workers = set()
         self.setup_ui(self)
 
-        self.snapshots_table_row = 0
-        logger.debug("Initializing snapshot scan on startup.")
-        self.scan_snapshots()
+        # Scan once the event loop is running so the empty form paints first
+        logger.debug("Scheduling snapshot scan on startup.")
+        QtCore.QTimer.singleShot(0, self.scan_snapshots)
 
         self.create_button.clicked.connect(self.create_start_event)
         self.view_action.triggered.connect(self.view_snapshot_event)
         self.delete_action.triggered.connect(self.delete_snapshot_event)
         self.compare_action.triggered.connect(self.compare_start_event)
-        self.report_action.triggered.connect(lambda: self.open_path(self.output_report))
-        self.report_button.clicked.connect(lambda: self.open_path(self.output_report))
-        self.folder_action.triggered.connect(lambda: self.open_path(self.output_dir))
-        self.folder_button.clicked.connect(lambda: self.open_path(self.output_dir))
+        self.report_action.triggered.connect(self.open_report_event)
+        self.report_button.clicked.connect(self.open_report_event)
+        self.folder_action.triggered.connect(self.open_folder_event)
+        self.folder_button.clicked.connect(self.open_folder_event)
 
     def scan_snapshots(self):
         """
         Scans the output directory for existing snapshots and adds them to the UI table.
         """
-        snapshots_path = os.path.join(self.output_dir, 'Snapshots')
-
-        if os.path.exists(snapshots_path):
-            logger.debug(f"Scanning snapshots in: {snapshots_path}")
-            for file in os.listdir(snapshots_path):
-                try:
-                    match = re.search(r'\[(.*)\]_\[(.*)\]_\[(.*)\].json', file)
-                    if match:
-                        snapshot = {
-                            'timestamp': match.group(3),
-                            'type': match.group(1),
-                            'name': match.group(2)
-                        }
-                        self.add_snapshot(snapshot)
-                except Exception as e:
-                    logger.debug(f"Unable to add snapshot from file: {file} {e}")
+        if os.path.exists(self.snapshots_path):
+            logger.debug(f"Scanning snapshots in: {self.snapshots_path}")
+            pending = []
+            with os.scandir(self.snapshots_path) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        match = _SNAPSHOT_RE.match(entry.name)
+                        if match:
+                            pending.append({
+                                'timestamp': match.group(3),
+                                'type': match.group(1),
+                                'name': match.group(2),
+                                'filename': entry.name
+                            })
+                    except Exception as e:
+                        logger.debug(f"Unable to add snapshot from file: {entry.name} {e}")
+
+            self.add_snapshots(pending)
 
     def create_start_event(self):
         """
@@ -340,61 +491,81 @@ class Form(QtWidgets.QWidget, Ui_Form):
             slot (dict): A dictionary containing snapshot information with keys
                          'name', 'type', and 'timestamp'.
         """
-        self.snapshots_table_row += 1
-        row = self.snapshots_table.rowCount()
-        self.snapshots_table.insertRow(row)
-        self.snapshots_table.setItem(row, 0, QtWidgets.QTableWidgetItem(slot['name']))
-        self.snapshots_table.setItem(row, 1, QtWidgets.QTableWidgetItem(slot['type']))
-        self.snapshots_table.setItem(row, 2, QtWidgets.QTableWidgetItem(slot['timestamp']))
+        self.snapshots_model.add_snapshot(slot)
         logger.debug(f"Snapshot added: {slot['name']} - {slot['type']} - {slot['timestamp']}")
 
-    def view_snapshot_event(self):
-        """
-        Opens selected snapshots by converting JSON data to an Excel workbook.
+    def add_snapshots(self, snapshots):
         """
-        from netcore import XLBW
-        data = self.get_selected_items()
-        snapshots_path = os.path.join(self.output_dir, 'Snapshots')
+        Adds several snapshot entries to the snapshots table in a single insert.
 
-        for row in data:
-            file_name = f"[{row['type']}]_[{row['name']}]_[{row['timestamp']}].json"
-            file_path = os.path.join(snapshots_path, file_name)
+        The model grows its row storage once for the whole batch, so attached views
+        invalidate their layout once, and view updates are suspended until all rows
+        are in place.
 
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    snapshot_data = json.load(f)
-
-                handle, xlsx_file = mkstemp(suffix='.xlsx')
-                workbook = XLBW(xlsx_file)
-                workbook.dump(snapshot_data['endpoints'])
-                workbook.close()
+        Args:
+            snapshots (iterable): Snapshot dictionaries with keys 'name', 'type', and 'timestamp'.
+        """
+        snapshots = list(snapshots)
+        self.snapshots_table.setUpdatesEnabled(False)
+        try:
+            self.snapshots_model.add_snapshots(snapshots)
+        finally:
+            self.snapshots_table.setUpdatesEnabled(True)
+        logger.debug(f"Snapshots added: {len(snapshots)}")
 
-                logger.info(f"Snapshot opened: {row['name']}")
-                self.open_path(xlsx_file)
-            else:
-                logger.warning(f"Snapshot file not found: {file_path}")
+    def view_snapshot_event(self):
+        """
+        Opens selected snapshots by converting JSON data to an Excel workbook
+        in a background worker.
+        """
+        logger.debug("Starting snapshot view process.")
+        view_worker = ViewEvent(self)
+        view_worker.open_file_signal.connect(self.open_path)
+        self.start_worker(view_worker)
 
     def delete_snapshot_event(self):
         """
-        Deletes selected snapshots from disk and removes them from the UI table.
-        Ensures proper row index handling during multiple deletions.
+        Deletes selected snapshots from disk in a background worker and removes
+        them from the UI table once the worker is done.
+        """
+        logger.debug("Starting snapshot delete process.")
+        delete_worker = DeleteEvent(self)
+        delete_worker.remove_snapshots_signal.connect(self.snapshots_model.remove_snapshots)
+        self.start_worker(delete_worker)
+
+    def start_worker(self, worker):
+        """
+        Starts a background worker and keeps a reference to it until it finishes,
+        so several workers of the same kind can run at once.
+
+        Args:
+            worker (QThread): The worker to start.
         """
-        data = self.get_selected_items()
-        snapshots_path = os.path.join(self.output_dir, 'Snapshots')
+        self.running_workers.add(worker)
+        worker.finished.connect(lambda: self.release_worker(worker))
+        worker.start()
 
-        # Sort by row index in descending order to prevent index shift issues
-        data.sort(key=lambda x: x['row'], reverse=True)
+    def release_worker(self, worker):
+        """
+        Drops the reference to a finished background worker.
 
-        for row in data:
-            file_name = f"[{row['type']}]_[{row['name']}]_[{row['timestamp']}].json"
-            file_path = os.path.join(snapshots_path, file_name)
+        Args:
+            worker (QThread): The finished worker.
+        """
+        worker.wait()
+        self.running_workers.discard(worker)
 
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                self.snapshots_table.removeRow(row['row'])
-                logger.info(f"Deleted snapshot: {row['name']}")
-            else:
-                logger.warning(f"Snapshot file not found for deletion: {file_path}")
+    def open_report_event(self, checked=False):
+        """
+        Opens the last generated comparison report.
+        """
+        self.open_path(self.output_report)
+
+    def open_folder_event(self, checked=False):
+        """
+        Opens the script output directory.
+        """
+        self.open_path(self.output_dir)
 
     def open_path(self, path: str):
         """
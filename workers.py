@@ -3,17 +3,52 @@ logger = logging.getLogger(__name__)
 
 import os
 import re
-import copy
+import atexit
+import threading
+import time
 import json
 import requests
 from datetime import datetime
-from socket import getfqdn
-from time import sleep
+from socket import gethostbyaddr
+from tempfile import mkstemp
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+try:
+    # Optional faster JSON library, stdlib json is used when unavailable
+    import orjson
+except ImportError:
+    orjson = None
 
 from PyQt5 import QtCore, QtWidgets, QtGui
 
+# Access port prefixes of MAC table entries included in a snapshot
+_IFACE_PREFIXES = ('Te', 'Gi', 'Fa', 'Eth', 'Two', 'Twe')
+
+# Interface labels used for normalized names, keyed by their lowercase form
+_IFACE_LABELS = {label.lower(): label for label in ('Te', 'Gi', 'Fa', 'Eth', 'Lo', 'Vl', 'Two', 'Twe')}
+
+# Interface label followed by the port identifier, e.g. GigabitEthernet1/0/1
+_IFACE_NORM_RE = re.compile(rf'^({"|".join(_IFACE_LABELS)})\D*(\d+\S*)', re.IGNORECASE)
+
+# "<OUI>  (base 16)  <vendor>" entries of the IEEE oui.txt listing
+_OUI_RE = re.compile(r'^([0-9A-F]{6})[ \t]+\(base 16\)[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+# Normalized interface names keyed by the name reported by the device
+_IFACE_NORM_CACHE = {}
+
+# Seconds to wait for a reverse DNS lookup once it has started
+_RESOLVE_TIMEOUT = 5
+
+# Seconds to wait for the IEEE server to respond while fetching the OUI registry
+_OUI_FETCH_TIMEOUT = 30
+
+# Separators stripped from MAC addresses before the OUI lookup
+_MAC_DELETE = str.maketrans('', '', '.-:')
+
+# OUI prefix of a MAC address with its separators stripped
+_OUI_PREFIX_RE = re.compile(r'[0-9A-Fa-f]{6}')
+
 
 class CreateEvent(QtCore.QThread):
     """
@@ -22,6 +57,12 @@ class CreateEvent(QtCore.QThread):
     """
     add_snapshot_signal = QtCore.pyqtSignal(dict)
 
+    # Device collection pool shared across snapshots, see get_executor()
+    executor = None
+
+    # Parsed OUI registry shared across snapshots: (registry file mtime, {OUI as int: vendor})
+    oui_cache = None
+
     def __init__(self, form):
         """
         Initialize the worker with form data.
@@ -31,6 +72,15 @@ class CreateEvent(QtCore.QThread):
         """
         super().__init__()
         self.form = form
+        # Reverse DNS lookup futures keyed by IP address, shared by all devices
+        self._fqdn_cache = {}
+        self._fqdn_lock = threading.Lock()
+        # Start times of the reverse DNS lookups keyed by IP address
+        self._lookup_started = {}
+        # Reverse DNS lookups of all devices share one pool, threads start on demand
+        self._resolver = ThreadPoolExecutor(max_workers=64, thread_name_prefix='dns')
+        # Limits simultaneous logins through the jumphost
+        self._connect_sem = threading.BoundedSemaphore(4)
 
     def run(self):
         """
@@ -45,9 +95,15 @@ class CreateEvent(QtCore.QThread):
         logger.info('Snapshot worker started.')
 
         self.data = {'endpoints': {}}
+        self._mac_to_index = {}
         self.load_mac_vendor()
-        self.thread_executor()
-        self.refactor_data()
+        try:
+            self.thread_executor()
+        finally:
+            # Drop lookups that have not started yet
+            for future in self._fqdn_cache.values():
+                future.cancel()
+            self._resolver.shutdown(wait=False)
         self.save_snapshot()
 
         logger.info('Snapshot worker finished.')
@@ -55,17 +111,36 @@ class CreateEvent(QtCore.QThread):
     def thread_executor(self):
         """
         Executes device data collection in parallel using threads.
+
+        Endpoints are merged into the snapshot as each device's task completes,
+        in device order.
         """
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            futures = {}
-            for device in self.devices:
-                futures[device] = executor.submit(self.create_task, device)
-                sleep(0.5)
+        executor = self.get_executor()
+        futures = {}
+        for device in self.devices:
+            futures[device] = executor.submit(self.create_task, device)
+
+        for device, future in futures.items():
+            exception = future.exception()
+            if exception:
+                logger.error(f'Exception for {device}: {exception}')
+            elif future.result():
+                self.merge_endpoints(future.result())
 
-            for device, future in futures.items():
-                exception = future.exception()
-                if exception:
-                    logger.error(f'Exception for {device}: {exception}')
+    @classmethod
+    def get_executor(cls):
+        """
+        Returns the device collection pool shared by all snapshots in the session.
+
+        The pool is created on first use and kept alive between snapshots. Threads are
+        only started as devices are submitted, up to the pool limit.
+
+        Returns:
+            ThreadPoolExecutor: The shared executor.
+        """
+        if cls.executor is None:
+            cls.executor = ThreadPoolExecutor(max_workers=64, thread_name_prefix='snap')
+        return cls.executor
 
     def create_task(self, device):
         """
@@ -73,6 +148,9 @@ class CreateEvent(QtCore.QThread):
 
         Args:
             device (str): IP or hostname of the network device.
+
+        Returns:
+            dict: Endpoint data keyed by MAC address, or None if the connection failed.
         """
         from netcore import GenericHandler
 
@@ -84,13 +162,14 @@ class CreateEvent(QtCore.QThread):
         } if self.form.session['JUMPHOST_IP'] else None
 
         try:
-            handler = GenericHandler(
-                hostname=device,
-                username=self.form.session['NETWORK_USERNAME'],
-                password=self.form.session['NETWORK_PASSWORD'],
-                proxy=proxy,
-                handler='NETMIKO'
-            )
+            with self._connect_sem:
+                handler = GenericHandler(
+                    hostname=device,
+                    username=self.form.session['NETWORK_USERNAME'],
+                    password=self.form.session['NETWORK_PASSWORD'],
+                    proxy=proxy,
+                    handler='NETMIKO'
+                )
             logger.info(f'Connection established to {device}')
         except Exception:
             logger.error(f'Connection failed to {device}')
@@ -99,19 +178,28 @@ class CreateEvent(QtCore.QThread):
         logger.info(f'Capturing and parsing data for {device}')
         mac_data = handler.sendCommand(cmd='show mac address', autoParse=True, key='mac_address')
         arp_data = handler.sendCommand(cmd='show ip arp', autoParse=True, key='mac_address')
-        iface_data = handler.sendCommand(cmd='show interface status', autoParse=True, key='interface')
+        access_macs = [mac for mac, mac_prop in mac_data.items() if mac_prop['ports'].startswith(_IFACE_PREFIXES)]
+
+        # The SSH channel runs one command at a time, so overlap hostname resolution
+        # with the interface status command instead of running commands concurrently
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            resolving = executor.submit(self.resolve_hostnames, {
+                arp_data[mac]['ip_address'] for mac in access_macs if arp_data.get(mac)
+            })
+            iface_data = handler.sendCommand(cmd='show interface status', autoParse=True,
+                                             key='interface') if access_macs else {}
+            hostnames = resolving.result()
 
         logger.info(f'Processing endpoint data for {device}')
         endpoint_data = {}
         idx = 0
+        iface_by_norm = {self.normalize_iface(iface): prop for iface, prop in iface_data.items()}
 
-        for mac, mac_prop in mac_data.items():
-            if not re.search(r'^(Te|Gi|Fa|Eth|Two|Twe)', mac_prop['ports']):
-                continue
-
+        for mac in access_macs:
+            mac_prop = mac_data[mac]
             idx += 1
-            hostname = getfqdn(arp_data[mac]['ip_address']) if arp_data.get(mac) else 'Unknown'
             ip_address = arp_data[mac]['ip_address'] if arp_data.get(mac) else 'Unknown'
+            hostname = hostnames.get(ip_address, ip_address) if arp_data.get(mac) else 'Unknown'
             vendor = self.get_mac_vendor(mac)
 
             endpoint_data[mac] = {
@@ -126,103 +214,197 @@ class CreateEvent(QtCore.QThread):
                 'Vlan': mac_prop['vlan_id']
             }
 
-            for iface, iface_prop in iface_data.items():
-                if self.normalize_iface(iface) == self.normalize_iface(mac_prop['ports']):
-                    endpoint_data[mac]['Speed'] = iface_prop['speed']
-                    endpoint_data[mac]['Duplex'] = iface_prop['duplex']
+            iface_prop = iface_by_norm.get(self.normalize_iface(mac_prop['ports']))
+            if iface_prop:
+                endpoint_data[mac]['Speed'] = iface_prop['speed']
+                endpoint_data[mac]['Duplex'] = iface_prop['duplex']
+
+        return endpoint_data
+
+    def resolve_hostnames(self, ip_addresses):
+        """
+        Resolves hostnames of IP addresses concurrently, sharing lookups between devices.
 
-        self.data['endpoints'][device] = endpoint_data
+        A lookup still running `_RESOLVE_TIMEOUT` seconds after it started is abandoned
+        for this device and the IP address is used as the hostname. The lookup itself
+        stays cached, so devices resolving the IP address later use its result.
+
+        Args:
+            ip_addresses (set): IP addresses to resolve.
+
+        Returns:
+            dict: Hostnames keyed by IP address, without the abandoned lookups.
+        """
+        with self._fqdn_lock:
+            pending = {}
+            for ip in ip_addresses:
+                future = self._fqdn_cache.get(ip)
+                if future is None:
+                    future = self._fqdn_cache[ip] = self._resolver.submit(self.timed_lookup, ip)
+                pending[ip] = future
+
+        hostnames = {}
+        while pending:
+            now = time.monotonic()
+            for ip, future in list(pending.items()):
+                if future.done():
+                    hostnames[ip] = future.result()
+                    del pending[ip]
+                elif now - self._lookup_started.get(ip, now) >= _RESOLVE_TIMEOUT:
+                    del pending[ip]
+            if not pending:
+                break
+
+            # Lookups still queued behind other devices have no deadline yet
+            started = [self._lookup_started[ip] for ip in pending if ip in self._lookup_started]
+            timeout = min(started) + _RESOLVE_TIMEOUT - now if started else _RESOLVE_TIMEOUT
+            wait(pending.values(), timeout=timeout, return_when=FIRST_COMPLETED)
+        return hostnames
+
+    def timed_lookup(self, ip_address):
+        """
+        Records when the lookup of an IP address starts running, then performs it.
+
+        Args:
+            ip_address (str): IP address.
+
+        Returns:
+            str: Hostname, or the IP address if it has no PTR record.
+        """
+        self._lookup_started[ip_address] = time.monotonic()
+        return self.lookup_hostname(ip_address)
+
+    @staticmethod
+    def lookup_hostname(ip_address):
+        """
+        Performs a single reverse DNS lookup.
+
+        Args:
+            ip_address (str): IP address.
+
+        Returns:
+            str: Hostname, or the IP address if it has no PTR record.
+        """
+        try:
+            return gethostbyaddr(ip_address)[0]
+        except (OSError, ValueError):
+            return ip_address
 
     def normalize_iface(self, iface):
         """
         Normalizes interface names to a consistent format.
 
+        Results are cached, since the same ports repeat across MAC entries and devices.
+
         Args:
             iface (str): Interface name.
 
         Returns:
             str: Normalized interface name.
         """
-        labels = ['Te', 'Gi', 'Fa', 'Eth', 'Lo', 'Vl', 'Two', 'Twe']
-        for label in labels:
-            if re.search(f'^{label}', iface, re.IGNORECASE):
-                port_id = re.search(r'(\d+\S*)', iface).group(0)
-                return f'{label}{port_id}'
-        return iface
-
-    def refactor_data(self):
+        normalized = _IFACE_NORM_CACHE.get(iface)
+        if normalized is None:
+            normalized = iface
+            match = _IFACE_NORM_RE.match(iface)
+            if match:
+                normalized = f'{_IFACE_LABELS[match.group(1).lower()]}{match.group(2)}'
+            _IFACE_NORM_CACHE[iface] = normalized
+        return normalized
+
+    def merge_endpoints(self, endpoint_data):
         """
-        Refactors collected data to consolidate duplicate MAC entries across switches.
-        """
-        logger.info('Refactoring snapshot data...')
-        ep_idx = 0
-        refactored = {}
-        mac_to_index = {}
+        Merges a device's endpoints into the snapshot, consolidating duplicate
+        MAC entries across switches.
 
-        for device in self.devices:
-            for mac, prop in self.data['endpoints'].get(device, {}).items():
-                if mac in mac_to_index:
-                    idx = mac_to_index[mac]
-                    refactored[idx]['Switch'].append(prop['Switch'])
-                    refactored[idx]['Interface'].append(prop['Interface'])
-                    refactored[idx]['Speed'].append(prop['Speed'])
-                    refactored[idx]['Duplex'].append(prop['Duplex'])
-                else:
-                    ep_idx += 1
-                    mac_to_index[mac] = ep_idx
-                    refactored[ep_idx] = {
-                        'MAC Address': prop['MAC Address'],
-                        'Vendor': prop['Vendor'],
-                        'Hostname': prop['Hostname'],
-                        'IP Address': prop['IP Address'],
-                        'Vlan': prop['Vlan'],
-                        'Switch': [prop['Switch']],
-                        'Interface': [prop['Interface']],
-                        'Speed': [prop['Speed']],
-                        'Duplex': [prop['Duplex']]
-                    }
-
-        self.data['endpoints'] = refactored
+        Args:
+            endpoint_data (dict): Endpoint data keyed by MAC address.
+        """
+        endpoints = self.data['endpoints']
+        for mac, prop in endpoint_data.items():
+            idx = self._mac_to_index.get(mac)
+            if idx is not None:
+                endpoints[idx]['Switch'].append(prop['Switch'])
+                endpoints[idx]['Interface'].append(prop['Interface'])
+                endpoints[idx]['Speed'].append(prop['Speed'])
+                endpoints[idx]['Duplex'].append(prop['Duplex'])
+            else:
+                idx = len(endpoints) + 1
+                self._mac_to_index[mac] = idx
+                endpoints[idx] = {
+                    'MAC Address': prop['MAC Address'],
+                    'Vendor': prop['Vendor'],
+                    'Hostname': prop['Hostname'],
+                    'IP Address': prop['IP Address'],
+                    'Vlan': prop['Vlan'],
+                    'Switch': [prop['Switch']],
+                    'Interface': [prop['Interface']],
+                    'Speed': [prop['Speed']],
+                    'Duplex': [prop['Duplex']]
+                }
 
     def save_snapshot(self):
         """
         Saves the processed data into a timestamped JSON file and emits signal.
         """
         logger.info('Saving snapshot to disk...')
-        snapshots_path = os.path.join(self.form.output_dir, 'Snapshots')
+        snapshots_path = self.form.snapshots_path
         if not os.path.exists(snapshots_path):
             os.mkdir(snapshots_path)
 
         timestamp = datetime.now().strftime('%Y-%m-%d_%H.%M')
-        filename = os.path.join(snapshots_path, f"[{self.type}]_[{self.name}]_[{timestamp}].json")
-
-        json.dump(self.data, open(filename, 'w'), indent=4)
+        basename = f"[{self.type}]_[{self.name}]_[{timestamp}].json"
+        filename = os.path.join(snapshots_path, basename)
+
+        if orjson:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
         self.add_snapshot_signal.emit({
             'timestamp': timestamp,
             'type': self.type,
-            'name': self.name
+            'name': self.name,
+            'filename': basename
         })
 
     def load_mac_vendor(self):
         """
         Loads MAC vendor OUI data from cache or fetches latest from IEEE if outdated.
+        If the download fails or contains no OUI entries, the existing registry file is used.
+
+        The parsed registry is kept on the class, so later snapshots only reload it
+        when the registry file has changed.
         """
         vendor_file = os.path.join(os.path.dirname(__file__), 'macvendor_registry.json')
         if not os.path.exists(vendor_file) or (
-                datetime.now() - datetime.fromtimestamp(os.path.getmtime(__file__))
+                datetime.now() - datetime.fromtimestamp(os.path.getmtime(vendor_file))
         ).days > 90:
             logger.info('Fetching latest OUI data from IEEE...')
-            oui_text = requests.get('https://standards-oui.ieee.org/oui/oui.txt').text
-            oui_data = {}
-
-            for line in oui_text.splitlines():
-                match = re.search(r'(\w+)\s+\(base 16\)\s+(.*)', line)
-                if match:
-                    oui_data[match.group(1)] = match.group(2)
+            try:
+                response = requests.get('https://standards-oui.ieee.org/oui/oui.txt', timeout=_OUI_FETCH_TIMEOUT)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                logger.warning(f'Unable to fetch OUI data, using existing registry: {e}')
+            else:
+                oui_data = dict(_OUI_RE.findall(response.text))
+                if oui_data:
+                    with open(vendor_file, 'w') as f:
+                        json.dump(oui_data, f, indent=4)
+                else:
+                    logger.warning('No OUI entries found in the fetched data, using existing registry.')
 
-            json.dump(oui_data, open(vendor_file, 'w'), indent=4)
+        if not os.path.exists(vendor_file):
+            logger.warning('No OUI registry available, vendors will be reported as Unknown.')
+            self.oui_data = {}
+            return
 
-        self.oui_data = json.load(open(vendor_file))
+        mtime = os.path.getmtime(vendor_file)
+        if CreateEvent.oui_cache is None or CreateEvent.oui_cache[0] != mtime:
+            with open(vendor_file) as f:
+                # Key vendors by the integer value of the OUI for cheaper lookups
+                CreateEvent.oui_cache = (mtime, {int(oui, 16): vendor for oui, vendor in json.load(f).items()})
+        self.oui_data = CreateEvent.oui_cache[1]
 
     def get_mac_vendor(self, mac):
         """
@@ -234,8 +416,66 @@ class CreateEvent(QtCore.QThread):
         Returns:
             str: Vendor name.
         """
-        normalized = re.sub(r'[.\-:]', '', mac).upper()[:6]
-        return self.oui_data.get(normalized, 'Unknown')
+        prefix = mac.translate(_MAC_DELETE)[:6]
+        if not _OUI_PREFIX_RE.fullmatch(prefix):
+            return 'Unknown'
+        return self.oui_data.get(int(prefix, 16), 'Unknown')
+
+
+class CompareRow:
+    """
+    A single MAC address in the comparison report.
+
+    The pre and post endpoint attributes are stored as tuples in `fields` order,
+    or None when the MAC is absent from that snapshot.
+    """
+    __slots__ = ('mac', 'observation', 'vendor', 'pre', 'post')
+
+    # Endpoint attributes compared between snapshots, in report column order
+    fields = ('Switch', 'Interface', 'Speed', 'Duplex', 'Vlan', 'IP Address', 'Hostname')
+    labels = ('Device', 'Interface', 'Speed', 'Duplex', 'Vlan', 'IP', 'Hostname')
+    columns = ('Address', 'Observation', 'Vendor') + tuple(f'Pre-{label}' for label in labels) + \
+        tuple(f'Post-{label}' for label in labels)
+
+    # Fields from this index on are flagged when they change; device and interface
+    # are expected to change after migration
+    compared_from = 2
+
+    # Placeholder attributes of a MAC absent from a snapshot
+    missing = ('???',) * len(fields)
+
+    # Cell format name used for each observation
+    observation_formats = {'MAC Learnt': 'ftGood', 'MAC Not Learnt': 'ftBad', 'New MAC': 'ftInfo'}
+
+    def __init__(self, mac, observation, vendor, pre, post):
+        """
+        Initialize a comparison row.
+
+        Args:
+            mac (str): MAC address.
+            observation (str): Comparison result ('MAC Learnt', 'MAC Not Learnt' or 'New MAC').
+            vendor (str): Vendor name.
+            pre (tuple): Pre-snapshot endpoint attributes, or None.
+            post (tuple): Post-snapshot endpoint attributes, or None.
+        """
+        self.mac = mac
+        self.observation = observation
+        self.vendor = vendor
+        self.pre = pre
+        self.post = post
+
+    @classmethod
+    def endpoint_fields(cls, endpoint):
+        """
+        Extracts the compared attributes of a snapshot endpoint.
+
+        Args:
+            endpoint (dict): Snapshot endpoint data.
+
+        Returns:
+            tuple: Endpoint attributes in `fields` order.
+        """
+        return tuple(endpoint[field] for field in cls.fields)
 
 
 class CompareEvent(QtCore.QThread):
@@ -245,6 +485,12 @@ class CompareEvent(QtCore.QThread):
     This class compares MAC address endpoint data between a pre and post snapshot
     to determine changes in the network state, and formats results accordingly.
     """
+    cell_format = {
+        'ftNormal': {'font_color': '#000000'},
+        'ftBad': {'bg_color': '#FFC7CE', 'font_color': '#9C0006'},
+        'ftGood': {'bg_color': '#C6EFCE', 'font_color': '#006100'},
+        'ftInfo': {'bg_color': '#FFEB9C', 'font_color': '#9C6500'},
+    }
 
     def __init__(self, form):
         """
@@ -265,21 +511,19 @@ class CompareEvent(QtCore.QThread):
         """
         logger.debug("WorkerCompareEvent started.")
         snapshots = self.form.get_selected_items()
-        snapshots_path = os.path.join(self.form.output_dir, 'Snapshots')
+        snapshots_path = self.form.snapshots_path
 
         # Determine which is pre and post snapshot
         pre_snapshot = snapshots[0] if snapshots[0]['type'] == 'Pre' else snapshots[1]
         post_snapshot = snapshots[0] if snapshots[0]['type'] == 'Post' else snapshots[1]
 
         # Load JSON snapshot data
-        pre_path = os.path.join(snapshots_path,
-                                f"[{pre_snapshot['type']}]_[{pre_snapshot['name']}]_[{pre_snapshot['timestamp']}].json")
-        post_path = os.path.join(snapshots_path,
-                                 f"[{post_snapshot['type']}]_[{post_snapshot['name']}]_[{post_snapshot['timestamp']}].json")
+        pre_path = os.path.join(snapshots_path, pre_snapshot['filename'])
+        post_path = os.path.join(snapshots_path, post_snapshot['filename'])
 
-        with open(pre_path) as pre_file, open(post_path) as post_file:
-            self.pre_snapshot_data = json.load(pre_file)['endpoints']
-            self.post_snapshot_data = json.load(post_file)['endpoints']
+        with open(pre_path, 'rb') as pre_file, open(post_path, 'rb') as post_file:
+            self.pre_snapshot_data = (orjson.loads(pre_file.read()) if orjson else json.load(pre_file))['endpoints']
+            self.post_snapshot_data = (orjson.loads(post_file.read()) if orjson else json.load(post_file))['endpoints']
 
         logger.info("Loaded pre and post snapshot data.")
 
@@ -308,102 +552,66 @@ class CompareEvent(QtCore.QThread):
         """
         Compares pre and post snapshot data to detect MAC address changes.
 
-        Builds a dictionary of comparison results with appropriate formatting for UI display.
+        Builds a dictionary of comparison rows keyed by MAC address; cell formatting
+        is derived from each row when the report is written.
         """
         logger.debug("Starting snapshot comparison.")
-        self.cell_format = {
-            'ftNormal': {'font_color': '#000000'},
-            'ftBad': {'bg_color': '#FFC7CE', 'font_color': '#9C0006'},
-            'ftGood': {'bg_color': '#C6EFCE', 'font_color': '#006100'},
-            'ftInfo': {'bg_color': '#FFEB9C', 'font_color': '#9C6500'},
-        }
+        pre_data, post_data = self.pre_snapshot_data, self.post_snapshot_data
+        endpoint_fields = CompareRow.endpoint_fields
         self.compare_data = {}
 
-        # Process MACs from pre-snapshot
-        for mac, pre in self.pre_snapshot_data.items():
-            post = self.post_snapshot_data.get(mac)
-            observation = 'MAC Not Learnt'
-            obs_format = self.cell_format['ftBad']
-
+        # Process MACs from pre-snapshot, in snapshot order
+        for mac, pre in pre_data.items():
+            post = post_data.get(mac)
             if post:
-                observation = 'MAC Learnt'
-                obs_format = self.cell_format['ftGood']
-
-            self.compare_data[mac] = {
-                'Address': {'value': mac, 'cellFormat': self.cell_format['ftNormal']},
-                'Observation': {'value': observation, 'cellFormat': obs_format},
-                'Vendor': {'value': pre['Vendor'], 'cellFormat': self.cell_format['ftNormal']},
-                'Pre-Device': {'value': pre['Switch'], 'cellFormat': self.cell_format['ftNormal']},
-                'Pre-Interface': {'value': pre['Interface'], 'cellFormat': self.cell_format['ftNormal']},
-                'Pre-Speed': {'value': pre['Speed'], 'cellFormat': self.cell_format['ftNormal']},
-                'Pre-Duplex': {'value': pre['Duplex'], 'cellFormat': self.cell_format['ftNormal']},
-                'Pre-Vlan': {'value': pre['Vlan'], 'cellFormat': self.cell_format['ftNormal']},
-                'Pre-IP': {'value': pre['IP Address'], 'cellFormat': self.cell_format['ftNormal']},
-                'Pre-Hostname': {'value': pre['Hostname'], 'cellFormat': self.cell_format['ftNormal']},
-                'Post-Device': {'value': '???', 'cellFormat': self.cell_format['ftBad']},
-                'Post-Interface': {'value': '???', 'cellFormat': self.cell_format['ftBad']},
-                'Post-Speed': {'value': '???', 'cellFormat': self.cell_format['ftBad']},
-                'Post-Duplex': {'value': '???', 'cellFormat': self.cell_format['ftBad']},
-                'Post-Vlan': {'value': '???', 'cellFormat': self.cell_format['ftBad']},
-                'Post-IP': {'value': '???', 'cellFormat': self.cell_format['ftBad']},
-                'Post-Hostname': {'value': '???', 'cellFormat': self.cell_format['ftBad']}
-            }
-
-            if post:
-                self.compare_data[mac].update({
-                    'Post-Device': {'value': post['Switch'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-Interface': {'value': post['Interface'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-Speed': self.match_attribute(pre['Speed'], post['Speed']),
-                    'Post-Duplex': self.match_attribute(pre['Duplex'], post['Duplex']),
-                    'Post-Vlan': self.match_attribute(pre['Vlan'], post['Vlan']),
-                    'Post-IP': self.match_attribute(pre['IP Address'], post['IP Address']),
-                    'Post-Hostname': self.match_attribute(pre['Hostname'], post['Hostname']),
-                })
-
-            if hasattr(logger, 'savings'):
-                logger.savings(1)
+                row = CompareRow(mac, 'MAC Learnt', pre['Vendor'], endpoint_fields(pre), endpoint_fields(post))
+            else:
+                row = CompareRow(mac, 'MAC Not Learnt', pre['Vendor'], endpoint_fields(pre), None)
+            self.compare_data[mac] = row
 
         # Process new MACs from post-snapshot
-        for mac, post in self.post_snapshot_data.items():
-            if mac not in self.pre_snapshot_data:
-                self.compare_data[mac] = {
-                    'Address': {'value': mac, 'cellFormat': self.cell_format['ftNormal']},
-                    'Observation': {'value': 'New MAC', 'cellFormat': self.cell_format['ftInfo']},
-                    'Vendor': {'value': post['Vendor'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Pre-Device': {'value': '???', 'cellFormat': self.cell_format['ftNormal']},
-                    'Pre-Interface': {'value': '???', 'cellFormat': self.cell_format['ftNormal']},
-                    'Pre-Speed': {'value': '???', 'cellFormat': self.cell_format['ftNormal']},
-                    'Pre-Duplex': {'value': '???', 'cellFormat': self.cell_format['ftNormal']},
-                    'Pre-Vlan': {'value': '???', 'cellFormat': self.cell_format['ftNormal']},
-                    'Pre-IP': {'value': '???', 'cellFormat': self.cell_format['ftNormal']},
-                    'Pre-Hostname': {'value': '???', 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-Device': {'value': post['Switch'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-Interface': {'value': post['Interface'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-Speed': {'value': post['Speed'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-Duplex': {'value': post['Duplex'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-Vlan': {'value': post['Vlan'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-IP': {'value': post['IP Address'], 'cellFormat': self.cell_format['ftNormal']},
-                    'Post-Hostname': {'value': post['Hostname'], 'cellFormat': self.cell_format['ftNormal']}
-                }
+        for mac, post in post_data.items():
+            if mac not in pre_data:
+                self.compare_data[mac] = CompareRow(mac, 'New MAC', post['Vendor'], None, endpoint_fields(post))
 
-                if hasattr(logger, 'savings'):
-                    logger.savings(1)
+        if hasattr(logger, 'savings'):
+            logger.savings(len(self.compare_data))
 
         logger.info("Snapshot comparison completed.")
 
-    def match_attribute(self, pre, post):
+    def row_cells(self, row):
         """
-        Compare a single attribute and apply conditional formatting.
+        Expands a comparison row into report cells with conditional formatting.
+
+        Post attributes that differ from the pre snapshot are flagged, and missing
+        post data is shown as '???'.
 
         Args:
-            pre (str): Pre-snapshot value.
-            post (str): Post-snapshot value.
+            row (CompareRow): Comparison row.
 
         Returns:
-            dict: Dictionary with value and formatting based on match.
+            list: (value, cell format) tuples in report column order.
         """
-        cell_style = self.cell_format['ftNormal'] if pre == post else self.cell_format['ftBad']
-        return {'value': post, 'cellFormat': cell_style}
+        ft_normal = self.cell_format['ftNormal']
+        ft_bad = self.cell_format['ftBad']
+        pre, post = row.pre, row.post
+
+        cells = [
+            (row.mac, ft_normal),
+            (row.observation, self.cell_format[CompareRow.observation_formats[row.observation]]),
+            (row.vendor, ft_normal),
+        ]
+        cells.extend((value, ft_normal) for value in pre or CompareRow.missing)
+
+        if post is None:
+            cells.extend((value, ft_bad) for value in CompareRow.missing)
+        elif pre is None:
+            cells.extend((value, ft_normal) for value in post)
+        else:
+            split = CompareRow.compared_from
+            cells.extend((value, ft_normal) for value in post[:split])
+            cells.extend((b, ft_normal if a == b else ft_bad) for a, b in zip(pre[split:], post[split:]))
+        return cells
 
     def write_report(self):
         """
@@ -416,7 +624,12 @@ class CompareEvent(QtCore.QThread):
         filename = f"{os.path.basename(os.path.dirname(__file__)).title()}_{timestamp}.xlsx"
         self.form.output_report = os.path.join(self.form.output_dir, filename)
 
-        workbook = XLBW(self.form.output_report)
+        try:
+            workbook = XLBW(self.form.output_report, options={'constant_memory': True, 'strings_to_urls': False})
+        except TypeError:
+            # netcore versions whose XLBW does not take workbook options; the report
+            # is the same, only held in memory until it is closed
+            workbook = XLBW(self.form.output_report)
         worksheet = workbook.add_worksheet('Mac Compare')
 
         base_fmt = {'font_size': '10', 'font_name': 'Segoe UI', 'font_color': '#000000', 'valign': 'top'}
@@ -430,40 +643,20 @@ class CompareEvent(QtCore.QThread):
                     'valign': 'top', 'bg_color': "#BF8F00"}
         pattern_fmt = {'pattern': 4}
 
-        pre_col_idx, post_col_idx = 4, 12
-        row_idx = 1
-        data = {idx + 1: val for idx, (key, val) in enumerate(self.compare_data.items())}
+        # Cell formats only differ by their 'cellFormat' overrides, so create each one once
+        fmt_cache = {}
 
-        worksheet.write(row_idx, 0, '#', workbook.add_format(header1_fmt))
-        col_idx = 1
-        for key in data[1].items():
-            if col_idx in (pre_col_idx, post_col_idx):
-                col_idx += 1
-            worksheet.write(row_idx, col_idx, key[0], workbook.add_format(header1_fmt))
-            col_idx += 1
+        def get_format(extra):
+            key = tuple(sorted(extra.items()))
+            cell_fmt = fmt_cache.get(key)
+            if cell_fmt is None:
+                cell_fmt = fmt_cache[key] = workbook.add_format({**base_fmt, **extra})
+            return cell_fmt
 
-        row_idx += 1
-        for row_key, row_values in data.items():
-            col_idx = 0
-            worksheet.write(row_idx, col_idx, row_key, workbook.add_format(base_fmt))
-            col_idx += 1
-            for _, cell in row_values.items():
-                if col_idx in (pre_col_idx, post_col_idx):
-                    col_idx += 1
-                fmt = copy.deepcopy(base_fmt)
-                if cell.get('cellFormat'):
-                    fmt.update(cell['cellFormat'])
-                cell_fmt = workbook.add_format(fmt)
-                value = '\n'.join(cell['value']) if isinstance(cell['value'], list) else cell['value']
-                worksheet.write(row_idx, col_idx, value, cell_fmt)
-                if cell.get('comment'):
-                    comment = '\n'.join(cell['comment']) if isinstance(cell['comment'], list) else cell['comment']
-                    worksheet.write_comment(row_idx, col_idx, comment)
-                col_idx += 1
-            row_idx += 1
-
-        worksheet.autofilter(1, 1, row_idx, col_idx - 1)
+        pre_col_idx, post_col_idx = 4, 12
+        last_col_idx = len(CompareRow.columns) + 2
 
+        # Rows are streamed to disk in constant_memory mode, so write them strictly top to bottom
         headers = ['#', 'Address', 'Observation', 'Vendor']
         header_fmt = workbook.add_format(header1_fmt)
         col_idx = 0
@@ -482,8 +675,147 @@ class CompareEvent(QtCore.QThread):
             if sub:
                 worksheet.write(1, idx, sub, sub_fmt)
 
+        row_idx = 2
+        for row_key, row in enumerate(self.compare_data.values(), start=1):
+            col_idx = 0
+            worksheet.write(row_idx, col_idx, row_key, get_format({}))
+            col_idx += 1
+            for value, cell_format in self.row_cells(row):
+                if col_idx in (pre_col_idx, post_col_idx):
+                    col_idx += 1
+                value = '\n'.join(value) if isinstance(value, list) else value
+                worksheet.write(row_idx, col_idx, value, get_format(cell_format))
+                col_idx += 1
+            row_idx += 1
+
+        worksheet.autofilter(1, 1, row_idx, last_col_idx)
+
         worksheet.set_column(pre_col_idx, pre_col_idx, 0.4, workbook.add_format(pattern_fmt))
         worksheet.set_column(post_col_idx, post_col_idx, 0.4, workbook.add_format(pattern_fmt))
         workbook.close()
 
         logger.info(f"Saved MAC comparison report: {self.form.output_report}")
+
+
+class ViewEvent(QtCore.QThread):
+    """
+    Worker thread that converts selected snapshots to Excel workbooks in the background.
+
+    Emits a signal with the path of each generated workbook so the UI can open it.
+    Workbooks are reused while the snapshot file is unchanged.
+    """
+    open_file_signal = QtCore.pyqtSignal(str)
+
+    # Generated workbooks keyed by snapshot path: (workbook path, snapshot mtime)
+    xlsx_cache = {}
+
+    def __init__(self, form):
+        """
+        Initialize the worker with the snapshots currently selected in the form.
+
+        Args:
+            form (QWidget): The form providing snapshot selection and output directory.
+        """
+        super().__init__()
+        self.form = form
+        self.snapshots = form.get_selected_items()
+
+    def run(self):
+        """
+        Entry point for the worker thread.
+
+        Loads each selected snapshot, dumps its endpoints to a temporary workbook
+        and emits the workbook path.
+        """
+        from netcore import XLBW
+
+        logger.debug("WorkerViewEvent started.")
+        snapshots_path = self.form.snapshots_path
+
+        for row in self.snapshots:
+            file_path = os.path.join(snapshots_path, row['filename'])
+
+            try:
+                mtime = os.path.getmtime(file_path)
+            except OSError:
+                logger.warning(f"Snapshot file not found: {file_path}")
+                continue
+
+            cached = self.xlsx_cache.get(file_path)
+            if cached and cached[1] == mtime and os.path.exists(cached[0]):
+                logger.info(f"Snapshot opened: {row['name']} (cached)")
+                self.open_file_signal.emit(cached[0])
+                continue
+
+            with open(file_path, 'rb') as f:
+                snapshot_data = orjson.loads(f.read()) if orjson else json.load(f)
+
+            handle, xlsx_file = mkstemp(suffix='.xlsx')
+            os.close(handle)
+            workbook = XLBW(xlsx_file)
+            workbook.dump(snapshot_data['endpoints'])
+            workbook.close()
+            self.xlsx_cache[file_path] = (xlsx_file, mtime)
+
+            logger.info(f"Snapshot opened: {row['name']}")
+            self.open_file_signal.emit(xlsx_file)
+
+    @classmethod
+    def remove_cached_workbooks(cls):
+        """
+        Deletes all temporary workbooks generated for viewed snapshots.
+        """
+        for xlsx_file, _ in cls.xlsx_cache.values():
+            try:
+                os.remove(xlsx_file)
+            except OSError:
+                pass
+        cls.xlsx_cache.clear()
+
+
+atexit.register(ViewEvent.remove_cached_workbooks)
+
+
+class DeleteEvent(QtCore.QThread):
+    """
+    Worker thread that deletes selected snapshot files in the background.
+
+    Emits the file names of the removed snapshots once all deletions are done,
+    so the UI can drop them from the table in one pass.
+    """
+    remove_snapshots_signal = QtCore.pyqtSignal(list)
+
+    def __init__(self, form):
+        """
+        Initialize the worker with the snapshots currently selected in the form.
+
+        Args:
+            form (QWidget): The form providing snapshot selection and output directory.
+        """
+        super().__init__()
+        self.form = form
+        self.snapshots = form.get_selected_items()
+
+    def run(self):
+        """
+        Entry point for the worker thread.
+
+        Removes each selected snapshot file from disk and emits the deleted file names.
+        """
+        logger.debug("WorkerDeleteEvent started.")
+        snapshots_path = self.form.snapshots_path
+        deleted_files = []
+
+        for row in self.snapshots:
+            file_path = os.path.join(snapshots_path, row['filename'])
+
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                logger.warning(f"Snapshot file not found for deletion: {file_path}")
+                continue
+
+            deleted_files.append(row['filename'])
+            logger.info(f"Deleted snapshot: {row['name']}")
+
+        self.remove_snapshots_signal.emit(deleted_files)